@@ -0,0 +1,46 @@
+#!/usr/bin/env python3.13
+"""
+mypyc build script for the Kubernetes Pod Resource Limits Checker
+
+Compiles k8s_pod_limits_checker.py ahead of time into a C extension module
+placed next to the script. Running the script as usual (e.g.
+'uv run k8s_pod_limits_checker.py') then uses the compiled module as long as
+it is newer than the source. Delete the generated .so file to go back to the
+pure Python version.
+
+Usage:
+    uv run --with mypy --with setuptools build.py
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+MODULE = "k8s_pod_limits_checker.py"
+
+
+def main() -> int:
+    """
+    Compile the checker module with mypyc.
+
+    Returns:
+        int: Exit code (0 for success, non-zero for failure)
+    """
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        print("Error: mypyc not found.")
+        print("If using uv: Run 'uv run --with mypy --with setuptools build.py'.")
+        print("If not using uv: Install with 'pip install mypy setuptools'")
+        return 1
+
+    project_dir = Path(__file__).resolve().parent
+    result = subprocess.run(
+        [sys.executable, "-m", "mypyc", "--ignore-missing-imports", MODULE],
+        cwd=project_dir,
+    )
+    return result.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,27 +10,99 @@ For usage instructions and examples, see the README.md file.
 """
 
 import sys
+import csv
+import io
 import json
 import argparse
+import importlib
+import importlib.machinery
 import logging
 import os
+import random
+from logging.handlers import RotatingFileHandler
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional, Iterable, Iterator, TextIO, BinaryIO, Callable, Union
 from dataclasses import dataclass, asdict
 
 try:
     from kubernetes import client, config
     from kubernetes.client.rest import ApiException
+    from kubernetes.watch.watch import iter_resp_lines
 except ImportError:
     print("Error: kubernetes package not found.")
     print("If using uv: Run 'uv run k8s_pod_limits_checker.py' and uv will install dependencies automatically.")
     print("If not using uv: Install with 'pip install kubernetes'")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# Maximum number of times a patch is retried when the API server responds with 429
+MAX_PATCH_RETRIES = 3
+
+# Consecutive failures (e.g. dropped connections) watch mode retries before giving up,
+# and the cap on the exponential backoff between those retries
+MAX_WATCH_RETRIES = 5
+MAX_WATCH_BACKOFF_SECONDS = 30
+
+# Like client-go, each watch asks the API server to close it after a random 5-10 minutes,
+# spreading reconnects out. The client gives up on a connection that has been silent for
+# a little longer than that, so a half-open connection is detected and retried instead of
+# blocking forever.
+MIN_WATCH_TIMEOUT_SECONDS = 300
+WATCH_REQUEST_TIMEOUT_MARGIN_SECONDS = 30
+
+# Annotation-only updates are sent as JSON Merge Patch rather than strategic merge
+MERGE_PATCH_CONTENT_TYPE = "application/merge-patch+json"
+
+# Warning annotation value for each (missing_cpu, missing_memory) combination
+ANNOTATION_VALUES = {
+    (True, True): "no-limits",
+    (True, False): "no-cpu-limit",
+    (False, True): "no-memory-limit",
+}
+
+# Patch bodies are built once and shared by every annotate_pod call
+ANNOTATION_PATCHES = {
+    key: {"metadata": {"annotations": {"warning": value}}}
+    for key, value in ANNOTATION_VALUES.items()
+}
+
+# Directory holding the log file and the scan result cache
+STATE_DIR = Path.home() / ".k8s_pod_checker"
+CACHE_FILE = STATE_DIR / "cache.json"
+
+# Size cap and number of rotated backups kept for the log file
+LOG_FILE_MAX_BYTES = 5_000_000
+LOG_FILE_BACKUP_COUNT = 3
+
+# Pods that have run to completion can no longer be scheduled, so they are skipped by default
+DEFAULT_FIELD_SELECTOR = "status.phase!=Succeeded,status.phase!=Failed"
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON, using orjson when it is installed and the standard library otherwise.
+
+    Args:
+        data: Raw JSON bytes or text
+
+    Returns:
+        Any: The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContainerLimitIssue:
-    """Represents a container with missing resource limits."""
+    """Represents a container with missing resource limits (slotted to keep large result sets compact)."""
     namespace: str
     pod_name: str
     container_name: str
@@ -38,6 +110,20 @@ class ContainerLimitIssue:
     missing_memory_limit: bool
 
 
+@dataclass(slots=True, frozen=True)
+class PodIssuesChange:
+    """
+    Represents a change in the missing-limit issues of a pod, as reported in watch mode.
+
+    ``event`` is ADDED when a pod starts having issues, MODIFIED when its set of issues
+    changes, and DELETED when it no longer has any (fixed or removed from the cluster).
+    """
+    event: str
+    namespace: str
+    pod_name: str
+    issues: List[ContainerLimitIssue]
+
+
 class KubernetesPodChecker:
     """Handles interaction with Kubernetes API to check pod resource limits."""
 
@@ -49,99 +135,590 @@ class KubernetesPodChecker:
             logger: Logger instance for logging operations
         """
         self.logger = logger
-        self.v1_client = None
+        self.v1_client: Any = None
+        self.patch_client: Any = None
+        # Current 'warning' annotation of each scanned pod with issues, keyed by (namespace, pod_name).
+        # Kept beside the issues rather than on them, since it is pod-level state and not part of the output.
+        self.current_warnings: Dict[Tuple[str, str], Optional[str]] = {}
+        # Set when the last scan could not list every pod, so its results are incomplete
+        self.scan_failed = False
+
+    def _init_clients(self) -> None:
+        """
+        Create the API clients once a cluster configuration has been loaded.
+
+        Patches go through a dedicated ApiClient whose Content-Type is JSON Merge Patch
+        (as used by `kubectl annotate`) instead of the default strategic merge patch.
+        """
+        self.v1_client = client.CoreV1Api()
+        patch_api_client = client.ApiClient()
+        patch_api_client.set_default_header("Content-Type", MERGE_PATCH_CONTENT_TYPE)
+        self.patch_client = client.CoreV1Api(patch_api_client)
 
     def connect(self) -> bool:
         """
         Connect to the Kubernetes cluster using in-cluster config or kubeconfig.
-        Tries in-cluster config first (for pods), then falls back to kubeconfig (for local dev).
+        Uses in-cluster config when KUBERNETES_SERVICE_HOST is set (inside a pod),
+        otherwise kubeconfig (for local dev).
 
         Returns:
             bool: True if connection successful, False otherwise
         """
+        in_cluster = bool(os.environ.get("KUBERNETES_SERVICE_HOST"))
+        source = "in-cluster config" if in_cluster else "kubeconfig"
         try:
-            # Try in-cluster config first (when running inside a pod)
-            config.load_incluster_config()
-            self.v1_client = client.CoreV1Api()
-            self.logger.info("Successfully connected to Kubernetes cluster using in-cluster config")
-            return True
-        except config.ConfigException:
-            # Fall back to kubeconfig (for local development)
-            try:
+            if in_cluster:
+                config.load_incluster_config()
+            else:
                 config.load_kube_config()
-                self.v1_client = client.CoreV1Api()
-                self.logger.info("Successfully connected to Kubernetes cluster using kubeconfig")
-                return True
-            except config.ConfigException as e:
-                self.logger.error(f"Failed to load kubeconfig: {e}")
-                return False
-            except Exception as e:
-                self.logger.error(f"Unexpected error loading kubeconfig: {e}")
-                return False
+            self._init_clients()
+            self.logger.info(f"Successfully connected to Kubernetes cluster using {source}")
+            return True
+        except config.ConfigException as e:
+            self.logger.error(f"Failed to load {source}: {e}")
+            return False
         except Exception as e:
             self.logger.error(f"Unexpected error connecting to cluster: {e}")
             return False
 
-    def get_containers_with_missing_limits(self, namespace: Optional[str] = None) -> List[ContainerLimitIssue]:
+    @staticmethod
+    def _selector_kwargs(label_selector: Optional[str], field_selector: Optional[str]) -> Dict[str, str]:
         """
-        Fetch pods and identify containers with missing limits.
+        Build the selector keyword arguments for a pod LIST or WATCH call.
 
         Args:
-            namespace: Optional namespace to filter pods. If None, checks all namespaces.
+            label_selector: Optional label selector
+            field_selector: Optional field selector
+
+        Returns:
+            Dict[str, str]: Keyword arguments for the selectors that are set
+        """
+        selectors = {}
+        if label_selector:
+            selectors["label_selector"] = label_selector
+        if field_selector:
+            selectors["field_selector"] = field_selector
+        return selectors
+
+    def _list_pods_page(
+        self,
+        namespace: Optional[str],
+        page_size: int,
+        continue_token: Optional[str],
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single page of pods as raw JSON.
+
+        The response is decoded straight into dicts instead of the client's model
+        classes, which avoids building thousands of model objects per page when
+        only a handful of fields are read.
+
+        Args:
+            namespace: Namespace to list pods in, or None for all namespaces
+            page_size: Maximum number of pods to return
+            continue_token: Continue token from the previous page, if any
+            label_selector: Optional label selector applied by the API server
+            field_selector: Optional field selector applied by the API server
 
         Returns:
-            List[ContainerLimitIssue]: List of containers with missing CPU or memory limits
+            Dict[str, Any]: The decoded PodList
+        """
+        selectors = self._selector_kwargs(label_selector, field_selector)
+        if namespace:
+            response = self.v1_client.list_namespaced_pod(
+                namespace=namespace, watch=False, limit=page_size, _continue=continue_token,
+                _preload_content=False, **selectors,
+            )
+        else:
+            response = self.v1_client.list_pod_for_all_namespaces(
+                watch=False, limit=page_size, _continue=continue_token,
+                _preload_content=False, **selectors,
+            )
+        return json_loads(response.data)
+
+    def _iter_pod_pages(
+        self,
+        namespace: Optional[str],
+        page_size: int,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resume_expired: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every page of a paginated pod LIST, following continue tokens.
+
+        A continue token expires once the snapshot it points into is compacted away,
+        which a slow LIST of a large cluster can outlive. The API server then answers
+        410 Gone with a fresh token that continues from a newer snapshot; with
+        ``resume_expired`` the LIST carries on from it rather than failing.
+
+        Args:
+            namespace: Namespace to list pods in, or None for all namespaces
+            page_size: Maximum number of pods per page
+            label_selector: Optional label selector applied by the API server
+            field_selector: Optional field selector applied by the API server
+            resume_expired: Whether to resume from a newer snapshot when a continue token expires
+
+        Yields:
+            Dict[str, Any]: Each decoded PodList page
+
+        Raises:
+            ApiException: If a page cannot be listed
+        """
+        continue_token: Optional[str] = None
+        while True:
+            try:
+                pod_list = self._list_pods_page(
+                    namespace, page_size, continue_token, label_selector, field_selector
+                )
+            except ApiException as e:
+                fresh_token: Optional[str] = None
+                if e.status == 410 and continue_token and resume_expired:
+                    try:
+                        fresh_token = json_loads(e.body)["metadata"]["continue"]
+                    except (TypeError, ValueError, KeyError):
+                        pass
+                if not fresh_token:
+                    raise
+                self.logger.warning(
+                    "LIST continue token expired - resuming from a newer snapshot, "
+                    "so pods changed in the meantime may be missed or reported twice"
+                )
+                continue_token = fresh_token
+                continue
+            yield pod_list
+
+            # An empty continue token means this was the last page
+            continue_token = pod_list["metadata"].get("continue")
+            if not continue_token:
+                break
+
+    def _scan_pod(self, pod: Dict[str, Any]) -> Iterator[ContainerLimitIssue]:
+        """
+        Yield the containers of a single pod that are missing resource limits.
+
+        The pod's current warning annotation is recorded in ``current_warnings``
+        when it has any issues.
+
+        Args:
+            pod: The pod as decoded JSON
+
+        Yields:
+            ContainerLimitIssue: Containers with missing CPU or memory limits
+        """
+        metadata = pod["metadata"]
+        namespace_name = metadata["namespace"]
+        pod_name = metadata["name"]
+        warning_recorded = False
+
+        # Check each container for missing limits
+        for container in pod["spec"]["containers"]:
+            resources = container.get("resources")
+            limits = resources.get("limits") if resources else None
+
+            if limits:
+                cpu_limit = limits.get("cpu")
+                memory_limit = limits.get("memory")
+                # Fast path: both limits set, which is the common case in a healthy cluster
+                if cpu_limit is not None and memory_limit is not None:
+                    continue
+                missing_cpu = cpu_limit is None
+                missing_memory = memory_limit is None
+            else:
+                missing_cpu = True
+                missing_memory = True
+
+            if not warning_recorded:
+                self.current_warnings[(namespace_name, pod_name)] = (metadata.get("annotations") or {}).get("warning")
+                warning_recorded = True
+
+            container_name = container["name"]
+            self.logger.debug(
+                f"Found container with missing limits: {namespace_name}/{pod_name}/{container_name} "
+                f"(cpu: {missing_cpu}, memory: {missing_memory})"
+            )
+            yield ContainerLimitIssue(
+                namespace=namespace_name,
+                pod_name=pod_name,
+                container_name=container_name,
+                missing_cpu_limit=missing_cpu,
+                missing_memory_limit=missing_memory,
+            )
+
+    def _read_cache(self, scope: Dict[str, Optional[str]]) -> Optional[Tuple[float, List[ContainerLimitIssue]]]:
         """
-        containers_with_issues = []
+        Load the cached scan results for a scan scope, if any.
+
+        Args:
+            scope: Namespace and selectors the results were scanned with
+
+        Returns:
+            Optional[Tuple[float, List[ContainerLimitIssue]]]: When the results were cached and the
+            cached issues, or None if missing, unreadable or for another scope
+        """
+        try:
+            cache = json_loads(CACHE_FILE.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable scan cache {CACHE_FILE}: {e}")
+            return None
+
+        # The file may have been written by another version or edited by hand, so check its shape
+        try:
+            if not isinstance(cache, dict):
+                raise TypeError(f"expected an object, got {type(cache).__name__}")
+            if cache.get("scope") != scope:
+                return None
+            timestamp = cache["ts"]
+            if not isinstance(timestamp, (int, float)):
+                raise TypeError(f"invalid timestamp {timestamp!r}")
+            issues = [ContainerLimitIssue(**issue_data) for issue_data in cache["issues"]]
+        except (KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable scan cache {CACHE_FILE}: {e!r}")
+            return None
+        return timestamp, issues
+
+    def _write_cache(self, scope: Dict[str, Optional[str]], issues: List[ContainerLimitIssue]) -> None:
+        """
+        Store scan results on disk for reuse by subsequent runs.
+
+        Args:
+            scope: Namespace and selectors that were scanned
+            issues: The containers with missing limits that were found
+        """
+        cache = {
+            "ts": time.time(),
+            "scope": scope,
+            "issues": [asdict(issue) for issue in issues],
+        }
+        try:
+            STATE_DIR.mkdir(exist_ok=True)
+            # Write to a temporary file first so concurrent runs never read a partial cache
+            tmp_file = CACHE_FILE.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(cache))
+            tmp_file.replace(CACHE_FILE)
+        except OSError as e:
+            self.logger.warning(f"Failed to write scan cache {CACHE_FILE}: {e}")
+
+    def get_containers_with_missing_limits(
+        self,
+        namespace: Optional[str] = None,
+        page_size: int = 500,
+        cache_ttl: float = 0,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = DEFAULT_FIELD_SELECTOR,
+        use_cached: bool = True,
+    ) -> Iterator[ContainerLimitIssue]:
+        """
+        Fetch pods page by page and yield containers with missing limits.
+
+        Pods are listed in chunks of ``page_size`` using the API's ``limit``/``continue``
+        tokens, so only one page of pod objects is held in memory at a time.
+
+        When ``cache_ttl`` is positive, results are cached on disk: a run within
+        ``cache_ttl`` seconds of the last scan skips the LIST entirely, and a run
+        that cannot reach the API server falls back to the last cached results.
+        Cached results do not record the pods' current annotations, so callers that
+        act on the results (annotation) pass ``use_cached=False`` to only refresh the cache.
+
+        If pods cannot be listed and no cached results are served instead, ``scan_failed``
+        is set once the generator is exhausted, as the issues yielded so far are incomplete.
+
+        Args:
+            namespace: Optional namespace to filter pods. If None, checks all namespaces.
+            page_size: Maximum number of pods requested per LIST call
+            cache_ttl: Seconds for which cached scan results are reused (0 disables caching)
+            label_selector: Optional label selector to narrow the pods listed by the API server
+            field_selector: Optional field selector to narrow the pods listed by the API server.
+                Defaults to skipping pods in a terminal (Succeeded/Failed) phase.
+            use_cached: Whether cached results may be served, either within the TTL or as a fallback
+
+        Yields:
+            ContainerLimitIssue: Containers with missing CPU or memory limits
+        """
+        issue_count = 0
+        cache = None
+        scanned_issues: Optional[List[ContainerLimitIssue]] = None
+        failed = False
+        scope = {"namespace": namespace, "label_selector": label_selector, "field_selector": field_selector}
+        self.scan_failed = False
+
+        if cache_ttl > 0:
+            if use_cached:
+                cache = self._read_cache(scope)
+            if cache is not None and time.time() - cache[0] < cache_ttl:
+                self.logger.info(f"Using cached scan results from {time.time() - cache[0]:.0f}s ago")
+                yield from cache[1]
+                return
+            scanned_issues = []
 
         try:
             # Fetch pods from specific namespace or all namespaces
             if namespace:
                 self.logger.info(f"Checking pods in namespace: {namespace}")
-                pod_list = self.v1_client.list_namespaced_pod(namespace=namespace, watch=False)
             else:
                 self.logger.info("Checking pods across all namespaces")
-                pod_list = self.v1_client.list_pod_for_all_namespaces(watch=False)
-
-            for pod in pod_list.items:
-                namespace_name = pod.metadata.namespace
-                pod_name = pod.metadata.name
-                containers = pod.spec.containers
-
-                # Check each container for missing limits
-                for container in containers:
-                    resources = container.resources
-                    limits = resources.limits if resources else None
-
-                    missing_cpu = limits is None or limits.get("cpu") is None
-                    missing_memory = limits is None or limits.get("memory") is None
-
-                    # Only add if at least one limit is missing
-                    if missing_cpu or missing_memory:
-                        issue = ContainerLimitIssue(
-                            namespace=namespace_name,
-                            pod_name=pod_name,
-                            container_name=container.name,
-                            missing_cpu_limit=missing_cpu,
-                            missing_memory_limit=missing_memory,
-                        )
-                        containers_with_issues.append(issue)
-                        self.logger.debug(
-                            f"Found container with missing limits: {namespace_name}/{pod_name}/{container.name} "
-                            f"(cpu: {missing_cpu}, memory: {missing_memory})"
-                        )
 
-            self.logger.info(
-                f"Found {len(containers_with_issues)} container(s) with missing resource limits"
-            )
-            return containers_with_issues
+            for pod_list in self._iter_pod_pages(
+                namespace, page_size, label_selector, field_selector, resume_expired=True
+            ):
+                for pod in pod_list["items"]:
+                    for issue in self._scan_pod(pod):
+                        issue_count += 1
+                        if scanned_issues is not None:
+                            scanned_issues.append(issue)
+                        yield issue
+
+            if scanned_issues is not None:
+                self._write_cache(scope, scanned_issues)
 
         except ApiException as e:
-            self.logger.error(f"Kubernetes API error: {e}")
-            return []
+            self.logger.error(f"Kubernetes API error: {e.status} - {e.reason}")
+            failed = True
         except Exception as e:
             self.logger.error(f"Unexpected error fetching pods: {e}")
-            return []
+            failed = True
+
+        # Serve stale results rather than nothing, unless part of a fresh scan was already emitted
+        if failed and cache is not None and issue_count == 0:
+            self.logger.warning(
+                f"Kubernetes API unavailable - reporting STALE cached scan results from "
+                f"{time.time() - cache[0]:.0f}s ago"
+            )
+            yield from cache[1]
+        elif failed:
+            self.scan_failed = True
+
+    def _list_pod_issues(
+        self,
+        namespace: Optional[str],
+        page_size: int,
+        label_selector: Optional[str],
+        field_selector: Optional[str],
+    ) -> Tuple[Dict[str, List[ContainerLimitIssue]], Optional[str]]:
+        """
+        List all pods and collect the issues of every pod that has any.
+
+        Args:
+            namespace: Namespace to list pods in, or None for all namespaces
+            page_size: Maximum number of pods per page
+            label_selector: Optional label selector applied by the API server
+            field_selector: Optional field selector applied by the API server
+
+        Returns:
+            Tuple[Dict[str, List[ContainerLimitIssue]], Optional[str]]: Issues keyed by pod UID,
+            and the resourceVersion to start watching from
+        """
+        pod_issues = {}
+        resource_version = None
+        for pod_list in self._iter_pod_pages(namespace, page_size, label_selector, field_selector):
+            # Every page of a paginated LIST is served from the same snapshot
+            resource_version = pod_list["metadata"].get("resourceVersion")
+            for pod in pod_list["items"]:
+                issues = list(self._scan_pod(pod))
+                if issues:
+                    pod_issues[pod["metadata"]["uid"]] = issues
+        return pod_issues, resource_version
+
+    @staticmethod
+    def _diff_pod_issues(
+        known: Dict[str, List[ContainerLimitIssue]], uid: str, namespace: str, pod_name: str,
+        issues: List[ContainerLimitIssue],
+    ) -> Optional[PodIssuesChange]:
+        """
+        Record a pod's latest issues and describe how they changed.
+
+        Args:
+            known: Issues keyed by pod UID, updated in place
+            uid: UID of the pod
+            namespace: The namespace of the pod
+            pod_name: The name of the pod
+            issues: The pod's current issues (empty if it has none or was deleted)
+
+        Returns:
+            Optional[PodIssuesChange]: The change, or None if the pod's issues are unchanged
+        """
+        previous = known.get(uid)
+        if issues:
+            if issues == previous:
+                return None
+            known[uid] = issues
+            return PodIssuesChange("MODIFIED" if previous else "ADDED", namespace, pod_name, issues)
+        if previous is None:
+            return None
+        del known[uid]
+        return PodIssuesChange("DELETED", namespace, pod_name, [])
+
+    @staticmethod
+    def _watch_pod_events(
+        list_func: Callable[..., Any], resource_version: Optional[str], watch_kwargs: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Open a single pod WATCH and yield its events as raw JSON.
+
+        Like _list_pods_page, this reads the response directly instead of going through
+        the client's model classes; the client's own watch helper cannot be used for this,
+        as it fails on ERROR events when deserialization is turned off.
+
+        Args:
+            list_func: list_namespaced_pod or list_pod_for_all_namespaces
+            resource_version: resourceVersion to start watching from
+            watch_kwargs: Namespace and selector keyword arguments for list_func
+
+        Yields:
+            Dict[str, Any]: Each ADDED, MODIFIED, DELETED or BOOKMARK event, until the
+            API server closes the watch
+
+        Raises:
+            ApiException: If the API server reports an error, e.g. 410 when the
+            resourceVersion is too old to resume from
+        """
+        timeout_seconds = random.randint(MIN_WATCH_TIMEOUT_SECONDS, 2 * MIN_WATCH_TIMEOUT_SECONDS)
+        response = list_func(
+            watch=True, resource_version=resource_version, allow_watch_bookmarks=True,
+            timeout_seconds=timeout_seconds,
+            _request_timeout=timeout_seconds + WATCH_REQUEST_TIMEOUT_MARGIN_SECONDS,
+            _preload_content=False, **watch_kwargs,
+        )
+        try:
+            for line in iter_resp_lines(response):
+                if not line:
+                    continue
+                event = json_loads(line)
+                if event["type"] == "ERROR":
+                    status = event["object"]
+                    raise ApiException(
+                        status=status.get("code"), reason=f"{status.get('reason')}: {status.get('message')}"
+                    )
+                yield event
+        finally:
+            response.close()
+            response.release_conn()
+
+    def watch_containers_with_missing_limits(
+        self,
+        namespace: Optional[str] = None,
+        page_size: int = 500,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = DEFAULT_FIELD_SELECTOR,
+    ) -> Iterator[PodIssuesChange]:
+        """
+        List pods once, then watch them and yield changes to their missing-limit issues.
+
+        The initial LIST is reported as ADDED changes; after that only pods whose
+        issues actually change are reported, so a steady-state cluster costs a single
+        open WATCH connection instead of repeated full LISTs. When the API server closes
+        the watch, it is reopened from the last resourceVersion seen; when that
+        resourceVersion has expired, pods are listed again and the differences reported.
+        Other errors, such as connection resets, are retried the same way after an
+        exponential backoff; the generator only returns after MAX_WATCH_RETRIES
+        consecutive failures.
+
+        Args:
+            namespace: Optional namespace to filter pods. If None, watches all namespaces.
+            page_size: Maximum number of pods requested per LIST call
+            label_selector: Optional label selector to narrow the pods watched
+            field_selector: Optional field selector to narrow the pods watched.
+                Defaults to skipping pods in a terminal (Succeeded/Failed) phase.
+
+        Yields:
+            PodIssuesChange: Changes in the issues of individual pods
+        """
+        if namespace:
+            self.logger.info(f"Watching pods in namespace: {namespace}")
+            list_func = self.v1_client.list_namespaced_pod
+            watch_kwargs: Dict[str, Any] = {"namespace": namespace}
+        else:
+            self.logger.info("Watching pods across all namespaces")
+            list_func = self.v1_client.list_pod_for_all_namespaces
+            watch_kwargs = {}
+        watch_kwargs.update(self._selector_kwargs(label_selector, field_selector))
+
+        known: Dict[str, List[ContainerLimitIssue]] = {}
+        # None until pods have been listed, and again whenever they have to be re-listed
+        resource_version: Optional[str] = None
+        failures = 0
+
+        while True:
+            try:
+                if resource_version is None:
+                    # (Re)build the state from a full LIST and report what changed since the last one
+                    pod_issues, resource_version = self._list_pod_issues(
+                        namespace, page_size, label_selector, field_selector
+                    )
+                    for uid in list(known):
+                        if uid not in pod_issues:
+                            stale = known[uid][0]
+                            self.current_warnings.pop((stale.namespace, stale.pod_name), None)
+                            change = self._diff_pod_issues(known, uid, stale.namespace, stale.pod_name, [])
+                            if change is not None:
+                                yield change
+                    for uid, issues in pod_issues.items():
+                        change = self._diff_pod_issues(known, uid, issues[0].namespace, issues[0].pod_name, issues)
+                        if change is not None:
+                            yield change
+
+                    self.logger.info(
+                        f"Tracking {len(known)} pod(s) with missing resource limits, watching for changes"
+                    )
+
+                for event in self._watch_pod_events(list_func, resource_version, watch_kwargs):
+                    failures = 0
+                    pod = event["object"]
+                    metadata = pod["metadata"]
+                    # Bookmarks carry nothing but the resourceVersion to resume from
+                    resource_version = metadata.get("resourceVersion", resource_version)
+                    if event["type"] not in ("ADDED", "MODIFIED", "DELETED"):
+                        continue
+                    issues = [] if event["type"] == "DELETED" else list(self._scan_pod(pod))
+                    if not issues:
+                        self.current_warnings.pop((metadata["namespace"], metadata["name"]), None)
+                    change = self._diff_pod_issues(
+                        known, metadata["uid"], metadata["namespace"], metadata["name"], issues
+                    )
+                    if change is not None:
+                        yield change
+
+            except ApiException as e:
+                # 410 Gone: our resourceVersion is too old to resume from, so list again
+                if e.status == 410:
+                    self.logger.warning("Watch resourceVersion expired, re-listing pods")
+                    resource_version = None
+                    continue
+                error = f"Kubernetes API error: {e.status} - {e.reason}"
+            except Exception as e:
+                error = f"Unexpected error watching pods: {e}"
+            else:
+                # The API server closed the watch after its timeout, which is routine - reopen it
+                continue
+
+            failures += 1
+            if failures > MAX_WATCH_RETRIES:
+                self.logger.error(f"{error} - giving up after {MAX_WATCH_RETRIES} retries")
+                return
+            delay = min(2 ** (failures - 1), MAX_WATCH_BACKOFF_SECONDS)
+            self.logger.warning(
+                f"{error} - re-listing pods in {delay}s (retry {failures}/{MAX_WATCH_RETRIES})"
+            )
+            time.sleep(delay)
+            resource_version = None
+
+    @staticmethod
+    def get_annotation_value(missing_cpu: bool, missing_memory: bool) -> Optional[str]:
+        """
+        Determine the warning annotation value for a pod's missing limits.
+
+        Args:
+            missing_cpu: Whether CPU limit is missing
+            missing_memory: Whether memory limit is missing
+
+        Returns:
+            Optional[str]: The annotation value, or None if no limit is missing
+        """
+        return ANNOTATION_VALUES.get((bool(missing_cpu), bool(missing_memory)))
 
     def annotate_pod(self, namespace: str, pod_name: str, missing_cpu: bool, missing_memory: bool) -> bool:
         """
@@ -157,32 +734,31 @@ class KubernetesPodChecker:
             bool: True if annotation was successful, False otherwise
         """
         try:
-            # Determine the appropriate annotation value
-            if missing_cpu and missing_memory:
-                annotation_value = "no-limits"
-            elif missing_cpu:
-                annotation_value = "no-cpu-limit"
-            elif missing_memory:
-                annotation_value = "no-memory-limit"
-            else:
+            # Look up the prebuilt patch for this combination of missing limits
+            patch = ANNOTATION_PATCHES.get((bool(missing_cpu), bool(missing_memory)))
+            if patch is None:
                 self.logger.warning(f"No missing limits to annotate for {namespace}/{pod_name}")
                 return False
-
-            # Prepare the patch
-            patch = {
-                "metadata": {
-                    "annotations": {
-                        "warning": annotation_value
-                    }
-                }
-            }
-
-            # Apply the patch
-            self.v1_client.patch_namespaced_pod(
-                name=pod_name,
-                namespace=namespace,
-                body=patch
-            )
+            annotation_value = patch["metadata"]["annotations"]["warning"]
+
+            # Apply the patch (sent as JSON Merge Patch), backing off when the
+            # API server throttles requests
+            for attempt in range(MAX_PATCH_RETRIES + 1):
+                try:
+                    self.patch_client.patch_namespaced_pod(
+                        name=pod_name,
+                        namespace=namespace,
+                        body=patch
+                    )
+                    break
+                except ApiException as e:
+                    if e.status != 429 or attempt == MAX_PATCH_RETRIES:
+                        raise
+                    delay = self._retry_after_seconds(e)
+                    self.logger.warning(
+                        f"Rate limited annotating pod {namespace}/{pod_name}, retrying in {delay}s"
+                    )
+                    time.sleep(delay)
 
             self.logger.info(
                 f"Successfully annotated pod {namespace}/{pod_name} with warning={annotation_value}"
@@ -200,36 +776,62 @@ class KubernetesPodChecker:
             )
             return False
 
-    def annotate_pods_with_issues(self, issues: List[ContainerLimitIssue]) -> Tuple[int, int]:
+    @staticmethod
+    def _retry_after_seconds(error: ApiException) -> float:
+        """
+        Read the Retry-After header of a throttled response, defaulting to one second.
+
+        Args:
+            error: The ApiException raised for a 429 response
+
+        Returns:
+            float: Number of seconds to wait before retrying
+        """
+        headers = error.headers or {}
+        try:
+            return float(headers.get("Retry-After", 1))
+        except (TypeError, ValueError):
+            return 1.0
+
+    def annotate_pods_with_issues(
+        self, issues: List[ContainerLimitIssue], max_workers: int = 10
+    ) -> Tuple[int, int]:
         """
         Annotate all pods that have containers with missing limits.
-        Groups issues by pod to avoid duplicate annotations.
+        Groups issues by pod to avoid duplicate annotations, skips pods whose
+        warning annotation is already up to date, then sends the remaining
+        patches concurrently using a bounded thread pool.
 
         Args:
             issues: List of ContainerLimitIssue objects
+            max_workers: Maximum number of patch requests in flight at once
 
         Returns:
             Tuple[int, int]: (number of successfully annotated pods, number of failed annotations)
         """
-        # Group issues by pod (namespace + pod_name)
-        pods_to_annotate = {}
+        # Group issues by pod: (namespace, pod_name) -> [missing_cpu, missing_memory]
+        pods: Dict[Tuple[str, str], List[bool]] = {}
 
         for issue in issues:
-            pod_key = f"{issue.namespace}/{issue.pod_name}"
-
-            if pod_key not in pods_to_annotate:
-                pods_to_annotate[pod_key] = {
-                    "namespace": issue.namespace,
-                    "pod_name": issue.pod_name,
-                    "missing_cpu": False,
-                    "missing_memory": False
-                }
-
-            # Track if any container in this pod is missing CPU or memory limits
-            if issue.missing_cpu_limit:
-                pods_to_annotate[pod_key]["missing_cpu"] = True
-            if issue.missing_memory_limit:
-                pods_to_annotate[pod_key]["missing_memory"] = True
+            pod_key = (issue.namespace, issue.pod_name)
+            missing = pods.get(pod_key)
+            if missing is None:
+                pods[pod_key] = [issue.missing_cpu_limit, issue.missing_memory_limit]
+            else:
+                # Track if any container in this pod is missing CPU or memory limits
+                missing[0] |= issue.missing_cpu_limit
+                missing[1] |= issue.missing_memory_limit
+
+        # Drop pods that already carry the correct annotation - no API call needed
+        pods_to_annotate = [
+            (namespace, pod_name, missing_cpu, missing_memory)
+            for (namespace, pod_name), (missing_cpu, missing_memory) in pods.items()
+            if self.current_warnings.get((namespace, pod_name)) != self.get_annotation_value(missing_cpu, missing_memory)
+        ]
+
+        skipped_count = len(pods) - len(pods_to_annotate)
+        if skipped_count:
+            self.logger.info(f"Skipping {skipped_count} pod(s) already annotated with the correct warning")
 
         # Annotate each pod
         success_count = 0
@@ -237,16 +839,17 @@ class KubernetesPodChecker:
 
         self.logger.info(f"Annotating {len(pods_to_annotate)} pod(s) with warning labels")
 
-        for pod_info in pods_to_annotate.values():
-            if self.annotate_pod(
-                namespace=pod_info["namespace"],
-                pod_name=pod_info["pod_name"],
-                missing_cpu=pod_info["missing_cpu"],
-                missing_memory=pod_info["missing_memory"]
-            ):
-                success_count += 1
-            else:
-                failure_count += 1
+        # The shared CoreV1Api client is safe to use from multiple threads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.annotate_pod, namespace, pod_name, missing_cpu, missing_memory)
+                for namespace, pod_name, missing_cpu, missing_memory in pods_to_annotate
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                else:
+                    failure_count += 1
 
         return success_count, failure_count
 
@@ -255,28 +858,45 @@ class OutputFormatter:
     """Handles formatting output in different formats."""
 
     @staticmethod
-    def format_table(issues: List[ContainerLimitIssue]) -> str:
+    def format_table(issues: Iterable[ContainerLimitIssue]) -> str:
         """
         Format issues as a human-readable table.
 
         Args:
-            issues: List of ContainerLimitIssue objects
+            issues: Iterable of ContainerLimitIssue objects
 
         Returns:
             str: Formatted table string
         """
-        if not issues:
+        headers = ["NAMESPACE", "POD NAME", "CONTAINER NAME", "MISSING CPU", "MISSING MEMORY"]
+
+        # Collect rows and track the widest value of each text column in a single pass
+        # (column widths need every row, so the table has to be buffered)
+        namespace_width = len(headers[0])
+        pod_name_width = len(headers[1])
+        container_name_width = len(headers[2])
+        rows = []
+        for issue in issues:
+            namespace, pod_name, container_name = issue.namespace, issue.pod_name, issue.container_name
+            if len(namespace) > namespace_width:
+                namespace_width = len(namespace)
+            if len(pod_name) > pod_name_width:
+                pod_name_width = len(pod_name)
+            if len(container_name) > container_name_width:
+                container_name_width = len(container_name)
+            rows.append((
+                namespace,
+                pod_name,
+                container_name,
+                "YES" if issue.missing_cpu_limit else "NO",
+                "YES" if issue.missing_memory_limit else "NO",
+            ))
+
+        if not rows:
             return "No containers with missing resource limits found."
 
-        # Calculate column widths
-        headers = ["NAMESPACE", "POD NAME", "CONTAINER NAME", "MISSING CPU", "MISSING MEMORY"]
-        col_widths = [
-            max(len(headers[0]), max((len(issue.namespace) for issue in issues), default=0)),
-            max(len(headers[1]), max((len(issue.pod_name) for issue in issues), default=0)),
-            max(len(headers[2]), max((len(issue.container_name) for issue in issues), default=0)),
-            len(headers[3]),
-            len(headers[4]),
-        ]
+        col_widths = [namespace_width, pod_name_width, container_name_width, len(headers[3]), len(headers[4])]
+        w0, w1, w2, w3, w4 = col_widths
 
         # Build table
         lines = []
@@ -293,96 +913,212 @@ class OutputFormatter:
         )
         lines.append(separator)
 
-        for issue in issues:
-            lines.append(
-                "| "
-                + " | ".join(
-                    f"{val:<{col_widths[i]}}"
-                    for i, val in enumerate(
-                        [
-                            issue.namespace,
-                            issue.pod_name,
-                            issue.container_name,
-                            "YES" if issue.missing_cpu_limit else "NO",
-                            "YES" if issue.missing_memory_limit else "NO",
-                        ]
-                    )
-                )
-                + " |"
-            )
+        for c0, c1, c2, c3, c4 in rows:
+            lines.append(f"| {c0:<{w0}} | {c1:<{w1}} | {c2:<{w2}} | {c3:<{w3}} | {c4:<{w4}} |")
 
         lines.append(separator)
         return "\n".join(lines)
 
     @staticmethod
-    def format_json(issues: List[ContainerLimitIssue]) -> str:
+    def format_json(issues: Iterable[ContainerLimitIssue]) -> bytes:
         """
         Format issues as JSON.
 
         Args:
-            issues: List of ContainerLimitIssue objects
+            issues: Iterable of ContainerLimitIssue objects
 
         Returns:
-            str: JSON formatted string
+            bytes: UTF-8 encoded JSON, ready to be written to a binary stream
         """
-        return json.dumps([asdict(issue) for issue in issues], indent=2)
+        if orjson is not None:
+            # orjson serializes dataclasses natively, so no intermediate dicts are built
+            return orjson.dumps(list(issues), option=orjson.OPT_INDENT_2)
+        return json.dumps([asdict(issue) for issue in issues], indent=2).encode()
 
     @staticmethod
-    def format_csv(issues: List[ContainerLimitIssue]) -> str:
+    def format_csv(issues: Iterable[ContainerLimitIssue]) -> str:
         """
         Format issues as CSV.
 
         Args:
-            issues: List of ContainerLimitIssue objects
+            issues: Iterable of ContainerLimitIssue objects
 
         Returns:
             str: CSV formatted string
         """
-        lines = ["NAMESPACE,POD_NAME,CONTAINER_NAME,MISSING_CPU_LIMIT,MISSING_MEMORY_LIMIT"]
+        buffer = io.StringIO()
+        OutputFormatter.format_csv_stream(issues, buffer)
+        return buffer.getvalue().rstrip("\n")
+
+    @staticmethod
+    def format_json_line(change: PodIssuesChange) -> bytes:
+        """
+        Format a watch-mode change as a single line of newline-delimited JSON.
 
+        Args:
+            change: The PodIssuesChange to format
+
+        Returns:
+            bytes: UTF-8 encoded JSON object followed by a newline
+        """
+        if orjson is not None:
+            return orjson.dumps(change, option=orjson.OPT_APPEND_NEWLINE)
+        return json.dumps(asdict(change)).encode() + b"\n"
+
+    @staticmethod
+    def format_table_stream(issues: Iterable[ContainerLimitIssue], out: TextIO) -> int:
+        """
+        Write issues as unaligned, tab-separated table rows as they arrive.
+
+        Unlike format_table this does not need every row up front to compute
+        column widths, so memory use stays constant regardless of result size.
+
+        Args:
+            issues: Iterable of ContainerLimitIssue objects
+            out: Text stream to write to
+
+        Returns:
+            int: Number of issues written
+        """
+        count = 0
         for issue in issues:
-            lines.append(
-                f'"{issue.namespace}","{issue.pod_name}","{issue.container_name}",'
-                f'"{issue.missing_cpu_limit}","{issue.missing_memory_limit}"'
+            if not count:
+                out.write("NAMESPACE\tPOD NAME\tCONTAINER NAME\tMISSING CPU\tMISSING MEMORY\n")
+            count += 1
+            out.write(
+                f"{issue.namespace}\t{issue.pod_name}\t{issue.container_name}\t"
+                f"{'YES' if issue.missing_cpu_limit else 'NO'}\t"
+                f"{'YES' if issue.missing_memory_limit else 'NO'}\n"
             )
 
-        return "\n".join(lines)
+        if not count:
+            out.write("No containers with missing resource limits found.\n")
+        return count
 
+    @staticmethod
+    def format_json_stream(issues: Iterable[ContainerLimitIssue], out: BinaryIO) -> int:
+        """
+        Write issues as a JSON array, one element at a time as they arrive.
+
+        The output is identical to format_json followed by a newline. Elements are
+        written as encoded bytes, skipping the text layer of the stream.
+
+        Args:
+            issues: Iterable of ContainerLimitIssue objects
+            out: Binary stream to write to
 
-def setup_logging(log_level: str) -> logging.Logger:
+        Returns:
+            int: Number of issues written
+        """
+        count = 0
+        for issue in issues:
+            if orjson is not None:
+                element = orjson.dumps(issue, option=orjson.OPT_INDENT_2)
+            else:
+                element = json.dumps(asdict(issue), indent=2).encode()
+            out.write(b",\n  " if count else b"[\n  ")
+            # Indent the element one level to nest it inside the array
+            out.write(element.replace(b"\n", b"\n  "))
+            count += 1
+
+        out.write(b"\n]\n" if count else b"[]\n")
+        return count
+
+    @staticmethod
+    def format_csv_stream(issues: Iterable[ContainerLimitIssue], out: TextIO) -> int:
+        """
+        Write issues as CSV, one row at a time as they arrive.
+
+        Args:
+            issues: Iterable of ContainerLimitIssue objects
+            out: Text stream to write to
+
+        Returns:
+            int: Number of issues written
+        """
+        # csv.writer quotes every field and escapes embedded quotes
+        writer = csv.writer(out, quoting=csv.QUOTE_ALL, lineterminator="\n")
+        header = "NAMESPACE,POD_NAME,CONTAINER_NAME,MISSING_CPU_LIMIT,MISSING_MEMORY_LIMIT\n"
+        count = 0
+        for issue in issues:
+            # The header is written once the first issue arrives, so log lines the scan
+            # emits before it (on the same stdout) cannot end up inside the CSV
+            if not count:
+                out.write(header)
+            writer.writerow((issue.namespace, issue.pod_name, issue.container_name,
+                             issue.missing_cpu_limit, issue.missing_memory_limit))
+            count += 1
+
+        if not count:
+            out.write(header)
+        return count
+
+
+def setup_logging(log_level: str, log_to_file: bool = True, console_to_stderr: bool = False) -> logging.Logger:
     """
     Configure logging for the application.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        log_to_file: Whether to also write logs to a size-capped rotating log file
+        console_to_stderr: Whether console logs go to stderr instead of stdout, keeping
+            stdout free for output that is written while logging is still going on
 
     Returns:
         logging.Logger: Configured logger instance
     """
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter(log_format))
-    
-    # File handler (optional, for daemon/cron usage)
-    log_dir = Path.home() / ".k8s_pod_checker"
-    log_dir.mkdir(exist_ok=True)
-    log_file = log_dir / "pod_checker.log"
-    
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(logging.Formatter(log_format))
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     
     logger = logging.getLogger("KubernetesPodChecker")
     logger.setLevel(numeric_level)
+    
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stderr if console_to_stderr else sys.stdout)
+    console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    
+    # File handler (optional, for daemon/cron usage)
+    if log_to_file:
+        log_file = STATE_DIR / "pod_checker.log"
+        try:
+            STATE_DIR.mkdir(exist_ok=True)
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT
+            )
+        except OSError as e:
+            # e.g. a read-only filesystem inside a pod - keep going with console logging only
+            logger.warning(f"File logging disabled, cannot write to {log_file}: {e}")
+        else:
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
     
     return logger
 
 
+def positive_int(value: str) -> int:
+    """
+    Parse a strictly positive integer command-line value.
+
+    Args:
+        value: The raw argument (or environment variable) value
+
+    Returns:
+        int: The parsed value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer greater than zero
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {number}")
+    return number
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command-line arguments.
@@ -401,6 +1137,13 @@ def parse_arguments() -> argparse.Namespace:
         help="Output format (default: table)",
     )
 
+    parser.add_argument(
+        "--no-align",
+        action="store_true",
+        help="With table output, stream unaligned tab-separated rows instead of buffering "
+             "every row to compute column widths. Useful for very large clusters.",
+    )
+
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -408,6 +1151,14 @@ def parse_arguments() -> argparse.Namespace:
         help="Logging level (default: INFO)",
     )
 
+    parser.add_argument(
+        "--log-file",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("LOG_FILE", "true").lower() == "true",
+        help="Also write logs to ~/.k8s_pod_checker/pod_checker.log, rotated at 5 MB (default: enabled). "
+             "Use --no-log-file to skip it. Can also be set via LOG_FILE environment variable (true/false).",
+    )
+
     parser.add_argument(
         "--namespace",
         "-n",
@@ -416,6 +1167,22 @@ def parse_arguments() -> argparse.Namespace:
         help="Check pods in a specific namespace. If not provided, checks all namespaces.",
     )
 
+    parser.add_argument(
+        "--label-selector",
+        "-l",
+        type=str,
+        default=None,
+        help="Only check pods matching this label selector (e.g. 'app=web,tier!=cache').",
+    )
+
+    parser.add_argument(
+        "--field-selector",
+        type=str,
+        default=DEFAULT_FIELD_SELECTOR,
+        help=f"Only check pods matching this field selector (default: '{DEFAULT_FIELD_SELECTOR}'). "
+             "Pass an empty string to check pods in every phase.",
+    )
+
     parser.add_argument(
         "--annotate",
         action="store_true",
@@ -425,9 +1192,111 @@ def parse_arguments() -> argparse.Namespace:
              "Can also be set via ANNOTATE environment variable (true/false).",
     )
 
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: list pods once, then watch them and print each change in a pod's "
+             "missing limits as a line of JSON. --output, --no-align and --cache-ttl are ignored.",
+    )
+
+    parser.add_argument(
+        "--page-size",
+        type=positive_int,
+        # A string default is converted by `type`, so a bad PAGE_SIZE is reported like a bad flag
+        default=os.getenv("PAGE_SIZE", "500"),
+        help="Number of pods fetched per API request when listing pods (default: 500). "
+             "Can also be set via PAGE_SIZE environment variable.",
+    )
+
+    parser.add_argument(
+        "--annotate-concurrency",
+        type=positive_int,
+        default=os.getenv("ANNOTATE_CONCURRENCY", "10"),
+        help="Maximum number of pod annotation requests sent in parallel (default: 10). "
+             "Can also be set via ANNOTATE_CONCURRENCY environment variable.",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=float(os.getenv("CACHE_TTL", "0")),
+        help="Reuse scan results cached in ~/.k8s_pod_checker/cache.json if they are younger than "
+             "this many seconds, and fall back to them when the API server is unreachable "
+             "(default: 0, caching disabled). Cached results are never used with --annotate. "
+             "Can also be set via CACHE_TTL environment variable.",
+    )
+
     return parser.parse_args()
 
 
+def run_watch(checker: KubernetesPodChecker, args: argparse.Namespace, logger: logging.Logger) -> int:
+    """
+    Run the checker in watch mode, printing every change as a line of JSON.
+
+    Args:
+        checker: Connected KubernetesPodChecker instance
+        args: Parsed command-line arguments
+        logger: Logger instance for logging operations
+
+    Returns:
+        int: Exit code (0 when interrupted, 1 if the watch could not continue)
+    """
+    formatter = OutputFormatter()
+    changes = checker.watch_containers_with_missing_limits(
+        namespace=args.namespace,
+        page_size=args.page_size,
+        label_selector=args.label_selector,
+        field_selector=args.field_selector,
+    )
+
+    # Patches are sent from a bounded thread pool so that a burst of changes, such as the
+    # initial LIST, never holds up the stream. The latest patch of each pod is kept so the
+    # next one waits for it, and an outdated annotation can never land last.
+    executor = ThreadPoolExecutor(max_workers=args.annotate_concurrency) if args.annotate else None
+    latest_patches: Dict[Tuple[str, str], Future] = {}
+
+    def annotate_in_order(previous: Optional[Future], namespace: str, pod_name: str,
+                          missing_cpu: bool, missing_memory: bool) -> bool:
+        if previous is not None:
+            wait([previous])
+        return checker.annotate_pod(namespace, pod_name, missing_cpu, missing_memory)
+
+    interrupted = False
+    sys.stdout.flush()
+    try:
+        for change in changes:
+            sys.stdout.buffer.write(formatter.format_json_line(change))
+            sys.stdout.buffer.flush()
+            if executor is None:
+                continue
+
+            # Annotate pods as their issues appear or change, skipping already correct annotations
+            pod_key = (change.namespace, change.pod_name)
+            if not change.issues:
+                latest_patches.pop(pod_key, None)
+                continue
+            missing_cpu = any(issue.missing_cpu_limit for issue in change.issues)
+            missing_memory = any(issue.missing_memory_limit for issue in change.issues)
+            previous = latest_patches.get(pod_key)
+            # While a patch is pending, the annotation seen in the event may be about to change
+            if (previous is not None and not previous.done()) or \
+                    checker.current_warnings.get(pod_key) != checker.get_annotation_value(missing_cpu, missing_memory):
+                latest_patches[pod_key] = executor.submit(
+                    annotate_in_order, previous, change.namespace, change.pod_name, missing_cpu, missing_memory
+                )
+    except KeyboardInterrupt:
+        interrupted = True
+        logger.info("Watch interrupted - exiting")
+        return 0
+    finally:
+        if executor is not None:
+            # Patches still queued on an interrupt are dropped; otherwise they are allowed to finish
+            executor.shutdown(cancel_futures=interrupted)
+
+    logger.error("Watch ended because the Kubernetes API could not be reached")
+    return 1
+
+
 def main() -> int:
     """
     Main entry point for the script.
@@ -436,7 +1305,11 @@ def main() -> int:
         int: Exit code (0 for success, 1 for failure)
     """
     args = parse_arguments()
-    logger = setup_logging(args.log_level)
+
+    # Annotation and the aligned table need every issue up front; otherwise output is streamed,
+    # interleaved with the scan's logging, so console logs are kept off stdout
+    stream_output = args.watch or (not args.annotate and (args.output != "table" or args.no_align))
+    logger = setup_logging(args.log_level, log_to_file=args.log_file, console_to_stderr=stream_output)
 
     logger.info("Starting Kubernetes Pod Resource Limits Checker")
 
@@ -446,13 +1319,33 @@ def main() -> int:
         logger.error("Failed to connect to Kubernetes cluster")
         return 1
 
-    # Fetch containers with missing limits
-    issues = checker.get_containers_with_missing_limits(namespace=args.namespace)
+    if args.watch:
+        return run_watch(checker, args, logger)
+
+    # Fetch containers with missing limits; the scan is lazy and pages through the API
+    issues: Iterable[ContainerLimitIssue] = checker.get_containers_with_missing_limits(
+        namespace=args.namespace,
+        page_size=args.page_size,
+        cache_ttl=args.cache_ttl,
+        label_selector=args.label_selector,
+        field_selector=args.field_selector,
+        # Never annotate from cached (possibly stale) results; the scan still refreshes the cache
+        use_cached=not args.annotate,
+    )
+
+    if not stream_output:
+        issue_list = list(issues)
+        issues = issue_list
+        logger.info(f"Found {len(issue_list)} container(s) with missing resource limits")
 
-    # Annotate pods if requested
-    if args.annotate and issues:
+    # Annotate pods if requested, but never from a partial scan
+    if args.annotate and checker.scan_failed:
+        logger.error("Pod scan did not complete - skipping annotation")
+    elif args.annotate and issue_list:
         logger.info("Annotation mode enabled - adding warning annotations to pods")
-        success_count, failure_count = checker.annotate_pods_with_issues(issues)
+        success_count, failure_count = checker.annotate_pods_with_issues(
+            issue_list, max_workers=args.annotate_concurrency
+        )
         logger.info(
             f"Annotation results: {success_count} successful, {failure_count} failed"
         )
@@ -460,23 +1353,56 @@ def main() -> int:
             logger.warning(
                 f"{failure_count} pod(s) could not be annotated. Check logs for details."
             )
-    elif args.annotate and not issues:
+    elif args.annotate:
         logger.info("No pods with missing limits found - nothing to annotate")
 
-    # Format and output results
+    # Format and output results - everything but the aligned table is streamed as issues arrive.
+    # JSON and the table are written as bytes straight to the binary buffer under stdout; the
+    # text layer is flushed first so nothing written through it can end up out of order.
     formatter = OutputFormatter()
+    sys.stdout.flush()
     if args.output == "json":
-        output = formatter.format_json(issues)
+        issue_count = formatter.format_json_stream(issues, sys.stdout.buffer)
     elif args.output == "csv":
-        output = formatter.format_csv(issues)
+        issue_count = formatter.format_csv_stream(issues, sys.stdout)
+    elif args.no_align:
+        issue_count = formatter.format_table_stream(issues, sys.stdout)
     else:
-        output = formatter.format_table(issues)
+        sys.stdout.buffer.write(formatter.format_table(issues).encode() + b"\n")
+    sys.stdout.flush()
+    sys.stdout.buffer.flush()
 
-    print(output)
+    # Streamed results are only counted once written, so report the total after the output
+    if stream_output:
+        logger.info(f"Found {issue_count} container(s) with missing resource limits")
+
+    if checker.scan_failed:
+        logger.error("Pod scan did not complete - the results are partial")
+        return 1
 
     logger.info("Kubernetes Pod Resource Limits Checker completed successfully")
     return 0
 
 
+def compiled_build_available() -> bool:
+    """
+    Check whether build.py has produced an up-to-date mypyc build of this module.
+
+    Returns:
+        bool: True if a compiled extension newer than this source file sits next to it
+    """
+    source = Path(__file__)
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        extension = source.with_name(source.stem + suffix)
+        if extension.exists() and extension.stat().st_mtime >= source.stat().st_mtime:
+            return True
+    return False
+
+
 if __name__ == "__main__":
+    if compiled_build_available():
+        # Importing the module by name loads the compiled extension, which takes
+        # precedence over the .py source on the import path
+        compiled_module = importlib.import_module("k8s_pod_limits_checker")
+        sys.exit(compiled_module.main())
     sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+In-memory stand-in for the parts of kubernetes.client.CoreV1Api used by the checker,
+and a helper to run the script's main() against it.
+"""
+
+import io
+import json
+import logging
+from contextlib import redirect_stderr, redirect_stdout
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, Union
+from unittest import mock
+
+from kubernetes.client.rest import ApiException
+
+import k8s_pod_limits_checker as checker_module
+
+
+def make_pod(
+    namespace: str,
+    name: str,
+    containers: Dict[str, Optional[Dict[str, str]]],
+    warning: Optional[str] = None,
+    uid: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build a pod as the API server returns it in raw JSON.
+
+    Args:
+        namespace: The namespace of the pod
+        name: The name of the pod
+        containers: Container name -> resource limits (None for no limits at all)
+        warning: Value of the pod's 'warning' annotation, if any
+        uid: UID of the pod (defaults to namespace/name)
+
+    Returns:
+        Dict[str, Any]: The pod
+    """
+    metadata: Dict[str, Any] = {"namespace": namespace, "name": name, "uid": uid or f"{namespace}/{name}"}
+    if warning is not None:
+        metadata["annotations"] = {"warning": warning}
+    return {
+        "metadata": metadata,
+        "spec": {
+            "containers": [
+                {"name": container_name, "resources": {"limits": limits} if limits else {}}
+                for container_name, limits in containers.items()
+            ]
+        },
+    }
+
+
+class StubWatchResponse:
+    """Raw WATCH response streaming one JSON event per line, as returned with _preload_content=False."""
+
+    def __init__(self, events: List[Union[Dict[str, Any], Exception]]):
+        self.events = events
+
+    def stream(self, amt: Optional[int] = None, decode_content: bool = False) -> Any:
+        for event in self.events:
+            if isinstance(event, Exception):
+                raise event
+            yield json.dumps(event).encode() + b"\n"
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+class StubCoreV1Api:
+    """
+    Serves a fixed list of pods and records LIST, WATCH and PATCH calls.
+
+    Each WATCH serves the next list of events queued in ``watches`` and then ends, as when
+    the API server closes a watch; an Exception in the list is raised mid-stream instead.
+    Once the queue is empty, WATCH calls fail with a 503.
+
+    A LIST fails with ``list_error`` if set, or with the error in ``page_errors`` for its
+    continue token (used once).
+    """
+
+    def __init__(self, pods: List[Dict[str, Any]], resource_version: str = "1"):
+        self.pods = pods
+        self.resource_version = resource_version
+        self.list_calls = 0
+        self.patches: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.list_error: Optional[ApiException] = None
+        self.page_errors: Dict[str, ApiException] = {}
+        self.watches: List[List[Union[Dict[str, Any], Exception]]] = []
+        self.watch_resource_versions: List[Optional[str]] = []
+        self.watch_timeouts: List[Tuple[int, float]] = []
+
+    def list_pod_for_all_namespaces(
+        self, limit: Optional[int] = None, _continue: Optional[str] = None, watch: bool = False, **kwargs: Any
+    ) -> Any:
+        if watch:
+            self.watch_resource_versions.append(kwargs.get("resource_version"))
+            self.watch_timeouts.append((kwargs["timeout_seconds"], kwargs["_request_timeout"]))
+            if not self.watches:
+                raise ApiException(status=503, reason="Service Unavailable")
+            return StubWatchResponse(self.watches.pop(0))
+
+        self.list_calls += 1
+        if self.list_error is not None:
+            raise self.list_error
+        if _continue in self.page_errors:
+            raise self.page_errors.pop(_continue)
+        start = int(_continue or 0)
+        end = start + (limit or len(self.pods))
+        pod_list = {
+            "metadata": {
+                "resourceVersion": self.resource_version,
+                "continue": str(end) if end < len(self.pods) else None,
+            },
+            "items": self.pods[start:end],
+        }
+        # Mimics a response requested with _preload_content=False
+        return SimpleNamespace(data=json.dumps(pod_list).encode())
+
+    def list_namespaced_pod(self, namespace: str, **kwargs: Any) -> Any:
+        return self.list_pod_for_all_namespaces(**kwargs)
+
+    def patch_namespaced_pod(self, name: str, namespace: str, body: Dict[str, Any]) -> None:
+        self.patches.append((namespace, name, body))
+        # Apply the patch so later LISTs see the new annotation, as on a real cluster
+        for pod in self.pods:
+            if pod["metadata"]["namespace"] == namespace and pod["metadata"]["name"] == name:
+                pod["metadata"].setdefault("annotations", {}).update(body["metadata"]["annotations"])
+
+
+def run_main(api: StubCoreV1Api, *args: str) -> Tuple[int, bytes]:
+    """
+    Run main() with the given arguments against a stub API.
+
+    Args:
+        api: The stub handed out for every API client
+        args: Command line arguments
+
+    Returns:
+        Tuple[int, bytes]: The exit code and everything written to stdout (stderr is discarded)
+    """
+    argv = ["k8s_pod_limits_checker.py", "--no-log-file", "--log-level", "ERROR", *args]
+    out = io.BytesIO()
+    # Skip loading a real kubeconfig and hand out the stub for every API client
+    with mock.patch("sys.argv", argv), \
+            mock.patch.object(checker_module.config, "load_kube_config"), \
+            mock.patch.object(checker_module.config, "load_incluster_config"), \
+            mock.patch.object(checker_module.client, "CoreV1Api", return_value=api), \
+            redirect_stdout(io.TextIOWrapper(out, write_through=True)), \
+            redirect_stderr(io.StringIO()):
+        exit_code = checker_module.main()
+        output = out.getvalue()
+    logging.getLogger("KubernetesPodChecker").handlers.clear()
+    return exit_code, output
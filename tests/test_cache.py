@@ -0,0 +1,158 @@
+"""
+Behavior tests for the on-disk scan result cache and its interaction with annotation.
+"""
+
+import json
+import logging
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from kubernetes.client.rest import ApiException
+
+import k8s_pod_limits_checker as checker_module
+from k8s_pod_limits_checker import KubernetesPodChecker
+from stub_api import StubCoreV1Api, make_pod, run_main
+
+
+# Scope recorded in the cache by a scan with default arguments
+DEFAULT_SCOPE = {"namespace": None, "label_selector": None, "field_selector": checker_module.DEFAULT_FIELD_SELECTOR}
+
+# Errors are logged by design in several tests; keep them off the test output
+logging.getLogger("test").addHandler(logging.NullHandler())
+
+
+def make_pods():
+    return [
+        make_pod("a", "p1", {"app": None}),
+        make_pod("a", "p2", {"app": {"cpu": "1", "memory": "1Gi"}}),
+        make_pod("b", "p3", {"app": {"cpu": "1"}, "sidecar": {"memory": "1Gi"}}),
+    ]
+
+
+class CacheTestCase(unittest.TestCase):
+    """Points the state directory at a temporary one and wires a checker to a stub API."""
+
+    def setUp(self):
+        state_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(state_dir.cleanup)
+        self.cache_file = Path(state_dir.name) / "cache.json"
+        for patcher in (
+            mock.patch.object(checker_module, "STATE_DIR", Path(state_dir.name)),
+            mock.patch.object(checker_module, "CACHE_FILE", self.cache_file),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.api = StubCoreV1Api(make_pods())
+        self.checker = self.make_checker()
+
+    def make_checker(self):
+        checker = KubernetesPodChecker(logging.getLogger("test"))
+        checker.v1_client = checker.patch_client = self.api
+        return checker
+
+    def scan(self, checker=None, **kwargs):
+        checker = checker or self.checker
+        return list(checker.get_containers_with_missing_limits(page_size=2, cache_ttl=60, **kwargs))
+
+    def age_cache(self, seconds):
+        cache = json.loads(self.cache_file.read_text())
+        cache["ts"] -= seconds
+        self.cache_file.write_text(json.dumps(cache))
+
+
+class TestScanCache(CacheTestCase):
+
+    def test_fresh_cache_skips_list(self):
+        first = self.scan()
+        self.assertEqual(self.api.list_calls, 2)
+
+        second = self.scan(self.make_checker())
+        self.assertEqual(second, first)
+        self.assertEqual(self.api.list_calls, 2)
+
+    def test_expired_cache_lists_again(self):
+        self.scan()
+        self.age_cache(120)
+
+        self.scan()
+        self.assertEqual(self.api.list_calls, 4)
+
+    def test_cache_scoped_by_namespace_and_selectors(self):
+        self.scan()
+        self.scan(label_selector="app=web")
+        self.assertEqual(self.api.list_calls, 4)
+
+    def test_stale_cache_served_when_api_fails(self):
+        first = self.scan()
+        self.age_cache(1000)
+        self.api.list_error = ApiException(status=500)
+
+        with self.assertLogs("test", level="WARNING") as logs:
+            second = self.scan()
+        self.assertEqual(second, first)
+        self.assertTrue(any("STALE" in line for line in logs.output))
+        self.assertFalse(self.checker.scan_failed)
+
+    def test_use_cached_false_lists_and_refreshes_cache(self):
+        self.scan()
+        self.api.pods.append(make_pod("c", "p4", {"app": None}))
+
+        issues = self.scan(use_cached=False)
+        self.assertEqual(self.api.list_calls, 4)
+        self.assertIn("p4", {issue.pod_name for issue in issues})
+        self.assertEqual(self.scan(self.make_checker()), issues)
+
+    def test_use_cached_false_does_not_fall_back(self):
+        self.scan()
+        self.api.list_error = ApiException(status=500)
+
+        self.assertEqual(self.scan(use_cached=False), [])
+        self.assertTrue(self.checker.scan_failed)
+
+    def test_malformed_cache_is_ignored(self):
+        for content in (
+            "not json",
+            "[]",
+            json.dumps({"scope": DEFAULT_SCOPE, "issues": []}),
+            json.dumps({"ts": "yesterday", "scope": DEFAULT_SCOPE, "issues": []}),
+            json.dumps({"ts": time.time(), "scope": DEFAULT_SCOPE, "issues": [{"namespace": "a"}]}),
+        ):
+            with self.subTest(content=content):
+                self.cache_file.write_text(content)
+                calls_before = self.api.list_calls
+                with self.assertLogs("test", level="WARNING"):
+                    issues = self.scan()
+                self.assertEqual(self.api.list_calls, calls_before + 2)
+                self.assertEqual(len(issues), 3)
+
+
+class TestCachedAnnotation(CacheTestCase):
+    """Runs main() end to end, as a cron job with --annotate and --cache-ttl would."""
+
+    def run_main(self, *args):
+        exit_code, _ = run_main(self.api, *args)
+        return exit_code
+
+    def test_second_annotate_run_within_ttl_does_not_repatch(self):
+        self.assertEqual(self.run_main("--annotate", "--cache-ttl", "60"), 0)
+        self.assertEqual({(ns, name) for ns, name, _ in self.api.patches}, {("a", "p1"), ("b", "p3")})
+
+        self.api.patches.clear()
+        self.assertEqual(self.run_main("--annotate", "--cache-ttl", "60"), 0)
+        self.assertEqual(self.api.patches, [])
+
+    def test_stale_fallback_is_not_annotated(self):
+        self.run_main("--cache-ttl", "60")
+        self.age_cache(1000)
+        self.api.list_error = ApiException(status=500)
+
+        self.assertEqual(self.run_main("--annotate", "--cache-ttl", "60"), 1)
+        self.assertEqual(self.api.patches, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Behavior tests for the paginated pod scan when the API server fails part-way through.
+"""
+
+import json
+import logging
+import unittest
+
+from kubernetes.client.rest import ApiException
+
+from k8s_pod_limits_checker import KubernetesPodChecker
+from stub_api import StubCoreV1Api, make_pod, run_main
+
+# Errors are logged by design in several tests; keep them off the test output
+logging.getLogger("test").addHandler(logging.NullHandler())
+
+
+def expired(continue_token=None):
+    """A 410 Gone for an expired continue token, optionally carrying a fresh one."""
+    error = ApiException(status=410, reason="Gone")
+    error.body = json.dumps({"kind": "Status", "code": 410, "metadata": {"continue": continue_token}})
+    return error
+
+
+class TestPaginatedScan(unittest.TestCase):
+
+    def setUp(self):
+        self.api = StubCoreV1Api([make_pod("a", f"p{i}", {"app": None}) for i in range(4)])
+        self.checker = KubernetesPodChecker(logging.getLogger("test"))
+        self.checker.v1_client = self.checker.patch_client = self.api
+
+    def scan(self):
+        return [issue.pod_name for issue in self.checker.get_containers_with_missing_limits(page_size=2)]
+
+    def test_expired_continue_token_resumes_from_fresh_token(self):
+        self.api.page_errors["2"] = expired("2")
+
+        with self.assertLogs("test", level="WARNING") as logs:
+            self.assertEqual(self.scan(), ["p0", "p1", "p2", "p3"])
+        self.assertIn("continue token expired", logs.output[0])
+        self.assertFalse(self.checker.scan_failed)
+
+    def test_failure_after_first_page_marks_scan_failed(self):
+        for error in (expired(), ApiException(status=500, reason="Internal Server Error")):
+            with self.subTest(status=error.status):
+                self.api.page_errors["2"] = error
+
+                with self.assertLogs("test", level="ERROR"):
+                    self.assertEqual(self.scan(), ["p0", "p1"])
+                self.assertTrue(self.checker.scan_failed)
+
+                self.assertEqual(self.scan(), ["p0", "p1", "p2", "p3"])
+                self.assertFalse(self.checker.scan_failed)
+
+    def test_partial_scan_exits_with_error_and_is_not_annotated(self):
+        self.api.page_errors["2"] = ApiException(status=500, reason="Internal Server Error")
+
+        exit_code, _ = run_main(self.api, "--annotate", "--page-size", "2")
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(self.api.patches, [])
+
+    def test_partial_streamed_output_exits_with_error(self):
+        self.api.page_errors["2"] = ApiException(status=500, reason="Internal Server Error")
+
+        exit_code, output = run_main(self.api, "--output", "json", "--page-size", "2")
+        self.assertEqual(exit_code, 1)
+        # The error is logged while the JSON array is still open, and must not end up inside it
+        self.assertEqual([issue["pod_name"] for issue in json.loads(output)], ["p0", "p1"])
+
+    def test_streamed_output_is_not_interleaved_with_logs(self):
+        for args in (("--output", "json"), ("--output", "csv"), ("--no-align",)):
+            with self.subTest(args=args):
+                exit_code, output = run_main(self.api, "--log-level", "DEBUG", "--page-size", "2", *args)
+                self.assertEqual(exit_code, 0)
+                self.assertNotIn(b"KubernetesPodChecker", output)
+                self.assertEqual(output.count(b"p0"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,252 @@
+"""
+Behavior tests for watch mode: tracking pod issues across a LIST and the WATCH events that follow.
+"""
+
+import logging
+import threading
+import unittest
+from unittest import mock
+
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+import k8s_pod_limits_checker as checker_module
+from k8s_pod_limits_checker import ContainerLimitIssue, KubernetesPodChecker, PodIssuesChange
+from stub_api import StubCoreV1Api, make_pod, run_main
+
+# Errors are logged by design in several tests; keep them off the test output
+logging.getLogger("test").addHandler(logging.NullHandler())
+
+
+def event(event_type, pod):
+    return {"type": event_type, "object": pod}
+
+
+def bookmark(resource_version):
+    return {"type": "BOOKMARK", "object": {"kind": "Pod", "metadata": {"resourceVersion": resource_version}}}
+
+
+def issue(namespace, pod_name, container_name, missing_cpu, missing_memory):
+    return ContainerLimitIssue(namespace, pod_name, container_name, missing_cpu, missing_memory)
+
+
+class TestDiffPodIssues(unittest.TestCase):
+
+    def setUp(self):
+        self.known = {}
+        self.issues = [issue("a", "p1", "app", True, True)]
+
+    def diff(self, issues):
+        return KubernetesPodChecker._diff_pod_issues(self.known, "uid-1", "a", "p1", issues)
+
+    def test_new_pod_with_issues_is_added(self):
+        self.assertEqual(self.diff(self.issues), PodIssuesChange("ADDED", "a", "p1", self.issues))
+        self.assertEqual(self.known, {"uid-1": self.issues})
+
+    def test_unchanged_issues_are_not_reported(self):
+        self.diff(self.issues)
+        self.assertIsNone(self.diff(list(self.issues)))
+
+    def test_changed_issues_are_modified(self):
+        self.diff(self.issues)
+        changed = [issue("a", "p1", "app", False, True)]
+        self.assertEqual(self.diff(changed), PodIssuesChange("MODIFIED", "a", "p1", changed))
+        self.assertEqual(self.known, {"uid-1": changed})
+
+    def test_resolved_issues_are_deleted(self):
+        self.diff(self.issues)
+        self.assertEqual(self.diff([]), PodIssuesChange("DELETED", "a", "p1", []))
+        self.assertEqual(self.known, {})
+
+    def test_pod_without_issues_is_ignored(self):
+        self.assertIsNone(self.diff([]))
+        self.assertEqual(self.known, {})
+
+
+class WatchTestCase(unittest.TestCase):
+    """Wires a checker to a stub API and keeps watch retries from sleeping."""
+
+    def setUp(self):
+        self.api = StubCoreV1Api([
+            make_pod("a", "p1", {"app": None}),
+            make_pod("a", "p2", {"app": {"cpu": "1", "memory": "1Gi"}}),
+        ])
+        self.checker = KubernetesPodChecker(logging.getLogger("test"))
+        self.checker.v1_client = self.api
+
+        sleep_patcher = mock.patch.object(checker_module.time, "sleep")
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def watch(self):
+        return self.checker.watch_containers_with_missing_limits(page_size=1)
+
+
+class TestWatchPodIssues(WatchTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Give up as soon as the queued watches run out instead of retrying
+        retries_patcher = mock.patch.object(checker_module, "MAX_WATCH_RETRIES", 0)
+        retries_patcher.start()
+        self.addCleanup(retries_patcher.stop)
+
+    def test_list_then_watch_events(self):
+        self.api.watches = [[
+            event("ADDED", make_pod("b", "p3", {"app": {"memory": "1Gi"}})),
+            # Only the annotation changed, so the pod's issues are unchanged
+            event("MODIFIED", make_pod("a", "p1", {"app": None}, warning="no-limits")),
+            event("MODIFIED", make_pod("a", "p1", {"app": {"cpu": "1"}})),
+            event("MODIFIED", make_pod("b", "p3", {"app": {"cpu": "1", "memory": "1Gi"}})),
+            event("DELETED", make_pod("a", "p1", {"app": {"cpu": "1"}})),
+            bookmark("7"),
+        ]]
+
+        self.assertEqual(list(self.watch()), [
+            PodIssuesChange("ADDED", "a", "p1", [issue("a", "p1", "app", True, True)]),
+            PodIssuesChange("ADDED", "b", "p3", [issue("b", "p3", "app", True, False)]),
+            PodIssuesChange("MODIFIED", "a", "p1", [issue("a", "p1", "app", False, True)]),
+            PodIssuesChange("DELETED", "b", "p3", []),
+            PodIssuesChange("DELETED", "a", "p1", []),
+        ])
+        self.assertEqual(self.api.list_calls, 2)
+
+    def test_closed_watch_resumes_from_last_resource_version(self):
+        self.api.watches = [[bookmark("7")], [event("MODIFIED", make_pod("a", "p1", {"app": None}))]]
+
+        list(self.watch())
+        self.assertEqual(self.api.watch_resource_versions, ["1", "7", "7"])
+        self.assertEqual(self.api.list_calls, 2)
+
+    def test_watches_are_bounded_by_timeouts(self):
+        self.api.watches = [[], []]
+
+        list(self.watch())
+        for timeout_seconds, request_timeout in self.api.watch_timeouts:
+            self.assertTrue(300 <= timeout_seconds <= 600)
+            # The client waits a little longer than the server, which ends the watch first
+            self.assertGreater(request_timeout, timeout_seconds)
+
+    def test_current_warning_tracked_per_pod(self):
+        self.api.watches = [[
+            event("MODIFIED", make_pod("a", "p1", {"app": None}, warning="no-limits")),
+        ]]
+        changes = self.watch()
+
+        next(changes)
+        self.assertEqual(self.checker.current_warnings, {("a", "p1"): None})
+        list(changes)
+        self.assertEqual(self.checker.current_warnings, {("a", "p1"): "no-limits"})
+
+    def test_expired_resource_version_relists_and_reports_differences(self):
+        self.api.pods.append(make_pod("a", "p3", {"app": None}))
+        self.api.watches = [[
+            {"type": "ERROR", "object": {"kind": "Status", "code": 410, "reason": "Expired", "message": "too old"}},
+        ]]
+        changes = self.watch()
+
+        self.assertEqual([change.pod_name for change in (next(changes), next(changes))], ["p1", "p3"])
+
+        # Pods change while the watch is behind: p3 is removed and p4 created
+        del self.api.pods[2]
+        self.api.pods.append(make_pod("b", "p4", {"app": {"cpu": "1"}}))
+        self.api.resource_version = "2"
+
+        self.assertEqual(list(changes), [
+            PodIssuesChange("DELETED", "a", "p3", []),
+            PodIssuesChange("ADDED", "b", "p4", [issue("b", "p4", "app", False, True)]),
+        ])
+        self.assertEqual(self.api.watch_resource_versions[:2], ["1", "2"])
+        self.sleep.assert_not_called()
+
+
+class WatchEndTrackingApi(StubCoreV1Api):
+    """Stub whose patches record whether the watch had already run out of events when they were sent."""
+
+    def __init__(self, pods):
+        super().__init__(pods)
+        self.watch_ended = threading.Event()
+        self.patched_after_watch_ended = []
+
+    def list_pod_for_all_namespaces(self, limit=None, _continue=None, watch=False, **kwargs):
+        if watch and not self.watches:
+            self.watch_ended.set()
+        return super().list_pod_for_all_namespaces(limit, _continue, watch, **kwargs)
+
+    def patch_namespaced_pod(self, name, namespace, body):
+        self.patched_after_watch_ended.append(self.watch_ended.wait(timeout=5))
+        super().patch_namespaced_pod(name, namespace, body)
+
+
+class TestWatchAnnotation(WatchTestCase):
+    """Runs main() in watch mode with --annotate, which sends patches from a thread pool."""
+
+    def test_patches_do_not_hold_up_the_stream(self):
+        self.api = WatchEndTrackingApi(self.api.pods)
+        self.api.watches = [[event("ADDED", make_pod("b", "p3", {"app": None}))]]
+
+        with mock.patch.object(checker_module, "MAX_WATCH_RETRIES", 0):
+            run_main(self.api, "--watch", "--annotate")
+
+        # Every patch was still in flight when the last event had been printed
+        self.assertEqual(self.api.patched_after_watch_ended, [True, True])
+
+    def test_patches_follow_changes_in_order(self):
+        self.api.watches = [[
+            event("ADDED", make_pod("b", "p3", {"app": {"memory": "1Gi"}})),
+            event("MODIFIED", make_pod("a", "p1", {"app": {"cpu": "1"}})),
+            event("MODIFIED", make_pod("a", "p1", {"app": {"memory": "1Gi"}})),
+        ]]
+
+        with mock.patch.object(checker_module, "MAX_WATCH_RETRIES", 0):
+            exit_code, output = run_main(self.api, "--watch", "--annotate", "--annotate-concurrency", "4")
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(len(output.splitlines()), 4)
+        warnings = {}
+        for namespace, name, body in self.api.patches:
+            warnings.setdefault((namespace, name), []).append(body["metadata"]["annotations"]["warning"])
+        self.assertEqual(warnings, {
+            ("a", "p1"): ["no-limits", "no-memory-limit", "no-cpu-limit"],
+            ("b", "p3"): ["no-cpu-limit"],
+        })
+
+
+class TestWatchRetries(WatchTestCase):
+
+    def test_connection_reset_is_retried_with_backoff(self):
+        self.api.watches = [
+            [ProtocolError("Connection reset by peer")],
+            [ProtocolError("Connection reset by peer")],
+            [event("MODIFIED", make_pod("a", "p1", {"app": None}))],
+        ]
+
+        with self.assertLogs("test", level="ERROR") as logs:
+            changes = list(self.watch())
+
+        self.assertEqual(changes, [PodIssuesChange("ADDED", "a", "p1", [issue("a", "p1", "app", True, True)])])
+        # Two resets, then a received event resets the count before the queue runs out
+        delays = [call.args[0] for call in self.sleep.call_args_list]
+        self.assertEqual(delays, [1, 2, 1, 2, 4, 8, 16])
+        # Every retry lists pods again, two pages each
+        self.assertEqual(self.api.list_calls, 2 * (1 + len(delays)))
+        self.assertIn("giving up after 5 retries", logs.output[-1])
+
+    def test_silent_connection_is_retried(self):
+        self.api.watches = [[ReadTimeoutError(None, "/api/v1/pods", "Read timed out.")]]
+
+        with self.assertLogs("test", level="WARNING") as logs:
+            list(self.watch())
+        self.assertIn("Read timed out", logs.output[0])
+        self.assertIn("re-listing pods in 1s", logs.output[0])
+
+    def test_backoff_is_capped(self):
+        with mock.patch.object(checker_module, "MAX_WATCH_RETRIES", 8), \
+                self.assertLogs("test", level="ERROR"):
+            list(self.watch())
+
+        delays = [call.args[0] for call in self.sleep.call_args_list]
+        self.assertEqual(delays, [1, 2, 4, 8, 16, 30, 30, 30])
+
+
+if __name__ == "__main__":
+    unittest.main()